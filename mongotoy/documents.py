@@ -1,7 +1,7 @@
 
-import abc
-from collections import OrderedDict
-from typing import TYPE_CHECKING, Any
+import functools
+import types
+from typing import TYPE_CHECKING, Any, Callable
 
 import bson
 import pymongo
@@ -10,10 +10,62 @@ from mongotoy.errors import DocumentError, DocumentValidationError, ValidationEr
 from mongotoy.fields import EmptyValue, FieldInfo
 
 
-_REGISTERED_DOCS = OrderedDict()
+_REGISTERED_DOCS = {}
+_EMPTY_FIELDS = types.MappingProxyType({})
 
 
-class BaseDocMeta(abc.ABCMeta):
+@functools.lru_cache(maxsize=None)
+def _get_embedded_indexes(prefix: str, document_cls: type['BaseDoc']) -> tuple[tuple[tuple, dict], ...]:
+    """
+    Builds the index keys and options of an embedded document with keys prefixed by the embedding field alias.
+
+    Args:
+        prefix (str): The alias of the field embedding the document.
+        document_cls (type[BaseDoc]): The embedded document class.
+
+    Returns:
+        tuple: A tuple of (keys, options) pairs.
+    """
+    indexes = []
+    for index_keys, index_options in document_cls._get_indexes():
+        # drop the generated name so it is regenerated from the prefixed keys, explicit names are kept
+        if index_options.get('name') == pymongo.IndexModel(list(index_keys)).document['name']:
+            index_options = {k: v for k, v in index_options.items() if k != 'name'}
+        index_new_keys = tuple((f'{prefix}.{index_key}', index_type) for index_key, index_type in index_keys)
+        indexes.append((index_new_keys, index_options))
+    return tuple(indexes)
+
+
+def _load_embedded_bson(mapper: mappers.EmbeddedDocumentMapper, value: dict, **options) -> 'BaseDoc':
+    """
+    Loads an embedded document from trusted BSON data, the document class is resolved on each call.
+
+    Args:
+        mapper (mappers.EmbeddedDocumentMapper): The mapper of the embedding field.
+        value (dict): The BSON data of the embedded document.
+
+    Returns:
+        BaseDoc: The embedded document instance.
+    """
+    return mapper.document_cls.from_bson(value)
+
+
+def _load_embedded_bson_list(mapper: mappers.EmbeddedDocumentMapper, value: list, **options) -> list['BaseDoc']:
+    """
+    Loads a list of embedded documents from trusted BSON data, the document class is resolved on each call.
+
+    Args:
+        mapper (mappers.EmbeddedDocumentMapper): The inner mapper of the embedding list field.
+        value (list): The BSON data of the embedded documents.
+
+    Returns:
+        list: The embedded document instances.
+    """
+    from_bson = mapper.document_cls.from_bson
+    return [from_bson(item) for item in value]
+
+
+class BaseDocMeta(type):
     """
     Metaclass for defining the behavior of classes derived from `BaseDoc`.
     This metaclass is responsible for combining fields from base classes and the current class,
@@ -33,9 +85,9 @@ class BaseDocMeta(abc.ABCMeta):
         _cls = super().__new__(mcls, name, bases, namespace)
         
         # add base classes fields
-        _fields = OrderedDict()
+        _fields = {}
         for base in bases:
-            _fields.update(getattr(base, '__fields__', {}))
+            _fields.update(getattr(base, '__fields__', _EMPTY_FIELDS))
 
         # add class namespace declared fields
         _fields.update({
@@ -46,11 +98,59 @@ class BaseDocMeta(abc.ABCMeta):
 
         # set cls fields
         _cls.__fields__ = _fields
+        _cls.__fields_tuple__ = tuple(_fields.values())
+
+        # set cls fields by key, names take precedence over aliases
+        _cls.__fields_by_key__ = {
+            **{field.alias: field for field in _cls.__fields_tuple__},
+            **_fields
+        }
+
+        # set cls init plan, a single key lookup is enough when alias and name match
+        _cls.__init_plan__ = tuple(
+            (field.__set__, field.name, field.alias, field.alias == field.name)
+            for field in _cls.__fields_tuple__
+        )
+
+        # set cls dump plans (name, key, bound dumper or None) for both key kinds, selected once per dump
+        # and the trusted bson load plan (name, alias, bound parser), references are resolved elsewhere
+        _dump_plan_name = []
+        _dump_plan_alias = []
+        _bson_plan = []
+        for field in _cls.__fields_tuple__:
+            # unwrap list mapper
+            field_mapper = field.mapper
+            if field_mapper._is_sequence:
+                field_mapper = field_mapper.inner_mapper
+
+            # referenced documents are stored by key name, back references are not stored at all
+            field_key = field.alias
+            if field_mapper._is_referenced:
+                if field_mapper.is_back_ref:
+                    continue
+                field_key = field_mapper.key_name
+            elif isinstance(field_mapper, mappers.EmbeddedDocumentMapper):
+                # embedded documents are loaded from trusted data as well
+                _load_bson = _load_embedded_bson_list if field.mapper._is_sequence else _load_embedded_bson
+                _bson_plan.append((field.name, field.alias, functools.partial(_load_bson, field_mapper)))
+            else:
+                _bson_plan.append((field.name, field.alias, field.mapper.parse))
+
+            # mappers that don't override dump_bson return the value as is, skip the call
+            field_dumper = field.mapper.dump_bson
+            if type(field.mapper).dump_bson is mappers.Mapper.dump_bson:
+                field_dumper = None
+
+            _dump_plan_name.append((field.name, field.name, field_dumper))
+            _dump_plan_alias.append((field.name, field_key, field_dumper))
+
+        _cls.__dump_plan_name__ = tuple(_dump_plan_name)
+        _cls.__dump_plan_alias__ = tuple(_dump_plan_alias)
+        _cls.__bson_plan__ = tuple(_bson_plan)
         
         # register document cls
-        if name in _REGISTERED_DOCS:
+        if _REGISTERED_DOCS.setdefault(name, _cls) is not _cls:
             raise DocumentError(f'Document {name} already defined, please use a different name')
-        _REGISTERED_DOCS[name] = _cls
         
         return _cls
     
@@ -75,27 +175,35 @@ class DocMeta(BaseDocMeta):
         # TODO prep config
         
         # check id field
-        _id_fields = [field.name for field in _cls.__fields__.values() if field.id_field]
-        if len(_id_fields) == 0:
+        _id_fields = [field for field in _cls.__fields_tuple__ if field.id_field]
+        if not _id_fields:
             raise DocumentError(f'No id field declared into document {_cls}')
         if len(_id_fields) > 1:
-            raise DocumentError(f'Too many id fields declared into document {_cls}.{_id_fields}') 
+            raise DocumentError(
+                f'Too many id fields declared into document {_cls}.{[field.name for field in _id_fields]}'
+            )
+        _id_field = _id_fields[0]
+
+        # set cls id field name, the field itself is a descriptor so it is not stored as cls attribute
+        _cls.__id_field_name__ = _id_field.name
         
         return _cls
         
         
-class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
+class BaseDoc(metaclass=BaseDocMeta):
     """
     Base class for defining documents with fields in a structured manner.
 
     Attributes:
         __fields__ (dict): A dictionary to store field information.
+        __fields_tuple__ (tuple): The declared fields, in order, for fast iteration.
         __data__ (dict): A dictionary to store document data.
 
     Methods:
         __init_instance__: Initializes an instance of the document with the given data.
         empty: Creates an empty instance of the document.
         parse: Parses a dictionary into a document instance.
+        from_bson: Loads a document instance from trusted BSON data.
         get_indexes: Retrieves a list of MongoDB index models based on document fields.
         dump_bson: Dumps the document data into a BSON format.
 
@@ -107,8 +215,16 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
     """
     if TYPE_CHECKING:
         __fields__: dict[str, FieldInfo]
+        __fields_tuple__: tuple[FieldInfo, ...]
+        __fields_by_key__: dict[str, FieldInfo]
+        __init_plan__: tuple[tuple[Callable, str, str, bool], ...]
+        __dump_plan_name__: tuple[tuple[str, str, Callable | None], ...]
+        __dump_plan_alias__: tuple[tuple[str, str, Callable | None], ...]
+        __bson_plan__: tuple[tuple[str, str, Callable], ...]
         __data__: dict[str, Any]
 
+    __slots__ = ('__data__',)
+
     def __init__(self, **data): 
         self.__init_instance__(self, data)
         
@@ -136,11 +252,14 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
             DocumentValidationError: If there are validation errors during document initialization.
         """
         instance.__data__ = {}
-        errors = []
-        for field in cls.__fields__.values():
+        errors = None
+        data_get = data.get
+        for field_set, name, alias, same_key in cls.__init_plan__:
             try:
-                value = data.get(field.alias, data.get(field.name, EmptyValue))
-                field.__set__(
+                value = data_get(alias, EmptyValue)
+                if value is EmptyValue and not same_key:
+                    value = data_get(name, EmptyValue)
+                field_set(
                     instance,
                     value=value,
                     use_defaults=use_defaults,
@@ -149,9 +268,13 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
                     **options
                 )
             except ValidationError as err:
-                errors.append(err)
+                # allocate errors list only when first error raises
+                if errors is None:
+                    errors = [err]
+                else:
+                    errors.append(err)
 
-        if errors:
+        if errors is not None:
             raise DocumentValidationError(
                 errors=errors,
                 document_cls=cls,
@@ -169,6 +292,10 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
             BaseDoc: An empty instance of the document.
         """
         instance = cls.__new__(cls)
+        # Empty values are not stored, so without defaults there is nothing to parse
+        if not use_defaults:
+            instance.__data__ = {}
+            return instance
         cls.__init_instance__(instance, data={}, use_defaults=use_defaults)
         return instance
     
@@ -203,6 +330,34 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
             **options
         )
         return instance 
+
+    @classmethod
+    def from_bson(cls, data: dict) -> 'BaseDoc':
+        """
+        Loads a document instance from trusted BSON data, e.g. a row decoded by a pymongo cursor.
+
+        Values are only converted by field mappers, field validators, nullability checks and
+        defaults are skipped, and the first mapper error is raised as is.
+        Embedded documents are loaded the same way, referenced document fields are not loaded.
+
+        Args:
+            data: BSON data keyed by field aliases.
+
+        Returns:
+            BaseDoc: A document instance.
+        """
+        instance = cls.__new__(cls)
+        instance.__data__ = instance_data = {}
+        empty_value = EmptyValue
+        data_get = data.get
+        for name, alias, parse in cls.__bson_plan__:
+            value = data_get(alias, empty_value)
+            if value is empty_value:
+                continue
+            if value is not None:
+                value = parse(value, strict=False, parse_bson=True, use_defaults=False)
+            instance_data[name] = value
+        return instance
     
     @classmethod
     def get_indexes(cls) -> list[pymongo.IndexModel]:
@@ -212,29 +367,36 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
         Returns:
             list: A list of pymongo.IndexModel instances.
         """
+        # new models on each call, built from the keys and options cached per class
+        return [
+            pymongo.IndexModel(list(index_keys), **index_options)
+            for index_keys, index_options in cls._get_indexes()
+        ]
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_indexes(cls) -> tuple[tuple[tuple, dict], ...]:
+        """
+        Builds the MongoDB index keys and options of the document once per class.
+
+        Returns:
+            tuple: A tuple of (keys, options) pairs.
+        """
         indexes = []
 
         # add field indexes
-        for field in cls.__fields__.values():
-            field_index = field.get_index()
-            if field_index:
-                indexes.append(field_index)
+        for field in cls.__fields_tuple__:
+            if field._index_spec is not None:
+                indexes.append(field._index_spec)
 
             # unwrap list mapper
             field_mapper = field.mapper
-            if isinstance(field_mapper, mappers.ListMapper):
+            if field_mapper._is_sequence:
                 field_mapper = field_mapper.inner_mapper
 
             # add EmbeddedDocumentMapper indexes
             if isinstance(field_mapper, mappers.EmbeddedDocumentMapper):
-                embedded_doc_cls = field_mapper.document_cls
-                for index in embedded_doc_cls.get_indexes():
-                    index_doc = index.document
-                    index_keys = index_doc.pop('key')
-                    index_new_keys = []
-                    for index_key, index_type in index_keys.items():
-                        index_new_keys.append((f'{field.alias}.{index_key}', index_type))
-                    indexes.append(pymongo.IndexModel(index_new_keys, **index_doc))
+                indexes.extend(_get_embedded_indexes(field.alias, field_mapper.document_cls))
 
             # TODO add Geo indexes
             # if isinstance(field_mapper, mappers.GeoDataMapper):
@@ -249,7 +411,7 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
             #             pymongo.IndexModel([(field.alias, pymongo.GEOSPHERE)])
             #         )
 
-        return indexes
+        return tuple(indexes)
     
     def __getitem__(self, key):
         """
@@ -264,8 +426,8 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
         Raises:
             DocumentError: If the field is not found or not declared.
         """
-        field = self.__fields__.get(key)
-        if not field:
+        field = self.__fields_by_key__.get(key)
+        if field is None:
             raise DocumentError(f'Field {key} not found or not declared yet')
         return field.__get__(self, self.__class__)
     
@@ -280,8 +442,8 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
         Raises:
             DocumentError: If the field is not found or not declared.
         """
-        field = self.__fields__.get(key)
-        if not field:
+        field = self.__fields_by_key__.get(key)
+        if field is None:
             raise DocumentError(f'Field {key} not found or not declared yet')
         field.__set__(self, item)
     
@@ -295,29 +457,35 @@ class BaseDoc(abc.ABC, metaclass=BaseDocMeta):
         Raises:
             DocumentError: If the field is not found or not declared.
         """
-        field = self.__fields__.get(key)
-        if not field:
+        field = self.__fields_by_key__.get(key)
+        if field is None:
             raise DocumentError(f'Field {key} not found or not declared yet')
         field.__delete__(self)
     
-    def dump_bson(self, by_alias: bool = True) -> bson.SON:
+    def dump_bson(self, by_alias: bool = True, as_son: bool = False) -> dict | bson.SON:
         """
         Dumps the document data into a BSON format.
 
         Args:
             by_alias: If True, uses field aliases as keys.
+            as_son: If True, wraps the result into a bson.SON instance.
 
         Returns:
-            bson.SON: A BSON document.
+            dict | bson.SON: A BSON document, plain dicts keep insertion order and are encoded as is.
         """
         data = {}
-        for field in self.__fields__.values():
-            key = field.alias if by_alias else field.name
-            value = self.__data__.get(field.name, EmptyValue)
-            if value not in (EmptyValue, None):
-                data[key] = field.mapper.dump_bson(value, by_alias=by_alias) if value is not None else value
-            
-        return bson.SON(data)        
+        empty_value = EmptyValue
+        data_get = self.__data__.get
+        dump_plan = self.__dump_plan_alias__ if by_alias else self.__dump_plan_name__
+        for name, key, dump_bson in dump_plan:
+            value = data_get(name, empty_value)
+            if value is empty_value or value is None:
+                continue
+            data[key] = value if dump_bson is None else dump_bson(value, by_alias=by_alias)
+
+        if as_son:
+            return bson.SON(data)
+        return data
     
     
 class EmbeddedDocument(BaseDoc):
@@ -336,7 +504,7 @@ class EmbeddedDocument(BaseDoc):
         __fields__ (dict): A dictionary to store field information.
         __data__ (dict): A dictionary to store document data.
     """
-    pass
+    __slots__ = ()
 
 class Document(BaseDoc, metaclass=DocMeta):
     """
@@ -360,7 +528,10 @@ class Document(BaseDoc, metaclass=DocMeta):
         id (ObjectId): An ObjectId field for the document ID with default settings.
     """
     if TYPE_CHECKING:
+        __id_field_name__: str
         document_config: dict
 
+    __slots__ = ()
+
     id = fields.ObjectIdField(id_field=True, default_factory=lambda: bson.ObjectId())
         
@@ -1,9 +1,25 @@
+import functools
+import itertools
 from typing import TYPE_CHECKING, Type
 
 if TYPE_CHECKING:
     from mongotoy.documents import BaseDoc
 
 
+@functools.lru_cache(maxsize=None)
+def _get_document_path(document_cls: Type['BaseDoc']) -> str:
+    """
+    Get the import path of a document class, computed once per class.
+
+    Args:
+        - document_cls (Type['BaseDoc']): The document class.
+
+    Returns:
+        str: The document class path, i.e. module.ClassName.
+    """
+    return f'{document_cls.__module__}.{document_cls.__name__}'
+
+
 class ErrorWrapper(Exception):
     """
     Wrapper class for handling errors in the mongotoy library.
@@ -37,11 +53,22 @@ class ErrorWrapper(Exception):
 
     def __init__(self, loc: str, error: Exception):
         self._loc, self._error = self._unwrap_error((loc,), error)
-        super().__init__(str(self._error))
+        super().__init__()
+
+    def __str__(self) -> str:
+        # message is built from the wrapped error only when needed
+        return str(self._error)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({str(self)!r})'
+
+    def __reduce__(self):
+        # args are left empty, rebuild from the unwrapped error and restore the full location
+        return type(self), (self._loc[0], self._error), {'_loc': self._loc}
 
     def _unwrap_error(self, loc: tuple[str], error: Exception) -> tuple[tuple[str], Exception]:
         """
-        Recursively unwrap nested ErrorWrapper instances to get the original error and its location.
+        Unwrap nested ErrorWrapper instances to get the original error and its location.
 
         Args:
             - loc (tuple[str]): The current location information.
@@ -52,7 +79,13 @@ class ErrorWrapper(Exception):
         """
         if not isinstance(error, ErrorWrapper):
             return loc, error
-        return self._unwrap_error((*loc, *error.loc), error.error)
+
+        # collect nested locations in a single list, the tuple is built once
+        parts = list(loc)
+        while isinstance(error, ErrorWrapper):
+            parts.extend(error._loc)
+            error = error._error
+        return tuple(parts), error
 
     @property
     def loc(self) -> tuple[str]:
@@ -115,7 +148,18 @@ class ValidationError(Exception):
 
     def __init__(self, errors: list[ErrorWrapper]):
         self._errors = errors
-        super().__init__(self._get_message())
+        super().__init__()
+
+    def __str__(self) -> str:
+        # message is built only when needed, raised errors are often caught and discarded
+        return self._get_message()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._get_message()!r})'
+
+    def __reduce__(self):
+        # args are left empty, rebuild from the constructor arguments
+        return type(self), (self._errors,)
 
     def _get_message(self) -> str:
         """
@@ -158,6 +202,7 @@ class DocumentValidationError(ValidationError):
 
     Properties:
         - document_cls (Type['BaseDoc']): The document class associated with the validation errors.
+        - document_path (str): The import path of the document class.
 
     Methods:
         - dump_dict(): Convert the document validation error information to a dictionary for easy serialization.
@@ -178,13 +223,42 @@ class DocumentValidationError(ValidationError):
     """
 
     def __init__(self, errors: list[ValidationError], document_cls: Type['BaseDoc']):
-        unwrapped_errors = []
-        for err in errors:
-            unwrapped_errors.extend(err.errors)
-
         self._document_cls = document_cls
-        self._document_path = f'{self._document_cls.__module__}.{self._document_cls.__name__}'
-        super().__init__(errors=unwrapped_errors)
+        super().__init__(errors=errors)
+
+    def __reduce__(self):
+        # args are left empty, rebuild from the constructor arguments
+        return type(self), (self._errors, self._document_cls)
+
+    @property
+    def document_cls(self) -> Type['BaseDoc']:
+        """
+        Get the document class associated with the validation errors.
+
+        Returns:
+            Type['BaseDoc']: The document class.
+        """
+        return self._document_cls
+
+    @property
+    def document_path(self) -> str:
+        """
+        Get the import path of the document class.
+
+        Returns:
+            str: The document class path, i.e. module.ClassName.
+        """
+        return _get_document_path(self._document_cls)
+
+    @functools.cached_property
+    def errors(self) -> list[ErrorWrapper]:
+        """
+        Get the list of validation errors, unwrapped from the document field errors on first access.
+
+        Returns:
+            list[ErrorWrapper]: List of ErrorWrapper instances representing validation errors.
+        """
+        return list(itertools.chain.from_iterable(err.errors for err in self._errors))
 
     def _get_message(self) -> str:
         """
@@ -193,10 +267,9 @@ class DocumentValidationError(ValidationError):
         Returns:
             str: The error message indicating the invalid data in the document and its location.
         """
-        msg = f'Invalid data at document {self._document_path}:'
-        for err in self.errors:
-            msg += f'\n  - {".".join(err.loc)}: {str(err)}'
-        return msg
+        lines = [f'Invalid data at document {self.document_path}:']
+        lines.extend(f'  - {".".join(err.loc)}: {err.error}' for err in self.errors)
+        return '\n'.join(lines)
 
     def dump_dict(self) -> dict:
         """
@@ -206,7 +279,7 @@ class DocumentValidationError(ValidationError):
             dict: A dictionary containing the details of document validation errors.
         """
         return {
-            'document_cls': self._document_path,
+            'document_cls': self.document_path,
             **super().dump_dict()
         }
 
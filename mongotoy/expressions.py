@@ -1,7 +1,25 @@
 import re
-from typing import Literal
+from typing import Iterable, Literal
 
 import pymongo
+from mongotoy.errors import FieldError
+
+
+def _compile_value(value):
+    """
+    Converts dict and list subclasses into plain dicts and lists, recursively.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The converted value, other values are returned as is.
+    """
+    if isinstance(value, dict):
+        return {key: _compile_value(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_compile_value(val) for val in value]
+    return value
 
 
 class QueryExpression(dict[str, list | dict]):
@@ -30,11 +48,10 @@ class QueryExpression(dict[str, list | dict]):
         Returns:
             QueryExpression: Result of the logical AND operation.
         """
-        if not other:
-            return self
-        if not self:
-            return other
-        return QueryExpression({'$and': [self, other]})
+        # one branch for the common case, empty operands are dropped
+        if self and other:
+            return QueryExpression({'$and': [self, other]})
+        return other or self
 
     def __or__(self, other: 'QueryExpression') -> 'QueryExpression':
         """
@@ -46,11 +63,10 @@ class QueryExpression(dict[str, list | dict]):
         Returns:
             QueryExpression: Result of the logical OR operation.
         """
-        if not other:
-            return self
-        if not self:
-            return other
-        return QueryExpression({'$or': [self, other]})
+        # one branch for the common case, empty operands are dropped
+        if self and other:
+            return QueryExpression({'$or': [self, other]})
+        return other or self
 
     def __invert__(self) -> 'QueryExpression':
         """
@@ -61,6 +77,72 @@ class QueryExpression(dict[str, list | dict]):
         """
         return QueryExpression({'$not': self})
 
+    def compile(self) -> dict:
+        """
+        Compiles the query expression into plain dicts and lists, ready to be BSON encoded.
+
+        Returns:
+            dict: The query as a plain dict.
+        """
+        return _compile_value(self)
+
+    @classmethod
+    def all(cls, expressions: Iterable['QueryExpression']) -> 'QueryExpression':
+        """
+        Represents the logical AND operation between many query expressions in a single flat `$and`.
+
+        Args:
+            expressions (Iterable[QueryExpression]): The query expressions.
+
+        Returns:
+            QueryExpression: Result of the logical AND operation.
+        """
+        return cls._join('$and', expressions)
+
+    @classmethod
+    def any(cls, expressions: Iterable['QueryExpression']) -> 'QueryExpression':
+        """
+        Represents the logical OR operation between many query expressions in a single flat `$or`.
+
+        Args:
+            expressions (Iterable[QueryExpression]): The query expressions.
+
+        Returns:
+            QueryExpression: Result of the logical OR operation.
+        """
+        return cls._join('$or', expressions)
+
+    @classmethod
+    def _join(cls, operator: str, expressions: Iterable['QueryExpression']) -> 'QueryExpression':
+        """
+        Joins query expressions with a logical operator, flattening nested uses of the same operator.
+
+        Args:
+            operator (str): The logical operator, `$and` or `$or`.
+            expressions (Iterable[QueryExpression]): The query expressions.
+
+        Returns:
+            QueryExpression: The joined query expression.
+        """
+        flat = []
+        for exp in expressions:
+            # skip empty expressions
+            if not exp:
+                continue
+            # unwrap expressions joined by the same operator
+            if len(exp) == 1 and operator in exp:
+                flat.extend(exp[operator])
+            else:
+                flat.append(exp)
+
+        if not flat:
+            return cls()
+        if len(flat) == 1:
+            # items unwrapped from a nested operator list may be plain dicts
+            exp = flat[0]
+            return exp if isinstance(exp, cls) else cls(exp)
+        return cls({operator: flat})
+
 
 class SortExpression(dict[str, Literal[-1, 1] | dict]):
     """
@@ -100,10 +182,7 @@ def Asc(*fields: str) -> SortExpression:
     Returns:
         SortExpression: Resulting ascending sort expression.
     """
-    sort_expression = SortExpression()
-    for field in fields:
-        sort_expression = sort_expression | SortExpression({str(field): pymongo.ASCENDING})
-    return sort_expression
+    return SortExpression({str(field): pymongo.ASCENDING for field in fields})
 
 
 def Desc(*fields: str) -> SortExpression:
@@ -116,10 +195,7 @@ def Desc(*fields: str) -> SortExpression:
     Returns:
         SortExpression: Resulting descending sort expression.
     """
-    sort_expression = SortExpression()
-    for field in fields:
-        sort_expression = sort_expression | SortExpression({str(field): pymongo.DESCENDING})
-    return sort_expression
+    return SortExpression({str(field): pymongo.DESCENDING for field in fields})
 
 
 class Q:
@@ -224,7 +300,7 @@ class Q:
         Returns:
             QueryExpression: The less-than-or-equal query expression.
         """
-        return QueryExpression({key: {'lte': value}})
+        return QueryExpression({key: {'$lte': value}})
 
     @classmethod
     def _in(cls, key: str, value: list) -> QueryExpression:
@@ -255,40 +331,64 @@ class Q:
         return QueryExpression({key: {'$nin': value}})
 
     @classmethod
-    def _match(cls, key: str, value: re.Pattern) -> QueryExpression:
+    def _match(cls, key: str, value: re.Pattern | str) -> QueryExpression:
         """
         Creates a regex query expression.
 
         Args:
             key (str): The field name.
-            value (re.Pattern): The regular expression pattern.
+            value (re.Pattern | str): The regular expression pattern, strings are sent to the server as is.
 
         Returns:
             QueryExpression: The regex query expression.
         """
         return QueryExpression({key: {'$regex': value}})
     
-    def __init__(self, **kwargs):
+    def __new__(cls, **kwargs) -> QueryExpression:
         """
         Constructor function to create Query expression.
 
         Args:
             **kwargs: Keyword arguments specifying field names and operator specifications.
+
+        Raises:
+            FieldError: If a keyword argument misses its operator or uses an unknown one.
         """
-        # Base query expression
-        q = QueryExpression()
+        # Collect single field clauses in a flat list
+        clauses = []
         
         for key, val in kwargs.items():
-            args = key.split('__')
-            
             # Split field and operator i.e. address__street__eq -> address.street eq
-            field = '.'.join(args[:-1])
-            operator = args[-1:][0]
+            field, sep, operator = key.rpartition('__')
+            if not sep:
+                raise FieldError(f'Missing query operator in {key!r}')
+            field = field.replace('__', '.')
             
             # Get operator function
-            operator = getattr(self.__class__, f'_{operator}')
-            # Concat query expressions
-            q = q & operator(field, val)
-
-        return q
+            try:
+                operator = _OPS[operator]
+            except KeyError:
+                raise FieldError(f'Unknown query operator {operator!r} in {key!r}') from None
+            clauses.append(operator(field, val))
 
+        # Merge clauses into a single expression when fields don't collide, otherwise use one flat $and
+        q = QueryExpression()
+        for clause in clauses:
+            q.update(clause)
+        if len(q) == len(clauses):
+            return q
+        return QueryExpression.all(clauses)
+
+
+# Operator functions by name, resolved once instead of per Q() keyword
+_OPS = {
+    'eq': Q._eq,
+    'ne': Q._ne,
+    'gt': Q._gt,
+    'gte': Q._gte,
+    'lt': Q._lt,
+    'lte': Q._lte,
+    'in': Q._in,
+    'nin': Q._nin,
+    'match': Q._match,
+}
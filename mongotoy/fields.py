@@ -1,7 +1,8 @@
 
 import datetime
-import inspect
+import functools
 import re
+import sys
 from typing import Any, Callable, Literal, Type, TYPE_CHECKING
 import bson
 import pymongo
@@ -18,6 +19,77 @@ EmptyValue = type('Empty', (), {'__repr__': lambda _: 'Empty()'})()
 IndexType = Literal[-1, 1, '2d', '2dsphere', 'hashed', 'text']
 
 
+_SHARED_MAPPERS = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> re.Pattern:
+    """
+    Compiles a regex pattern once, fields declared with the same pattern share it.
+
+    Args:
+        pattern (str): The regular expression pattern.
+
+    Returns:
+        re.Pattern: The compiled pattern.
+    """
+    return re.compile(pattern)
+
+
+def _get_option_key(value) -> tuple:
+    """
+    Get the cache key of a mapper option, typed so equal values of different types don't collide.
+
+    Args:
+        value: The option value.
+
+    Returns:
+        tuple: The option key.
+    """
+    # sequences are keyed by their items, the mapper keeps the caller's container
+    if type(value) in (tuple, list):
+        return type(value), tuple(_get_option_key(item) for item in value)
+    return type(value), value
+
+
+def _get_mapper(mapper_cls: Type[Mapper], **options) -> Mapper:
+    """
+    Get a mapper instance shared by all fields declared with the same options.
+
+    Mappers with unhashable options are not shared, a fresh instance is built instead.
+
+    Args:
+        mapper_cls (Type[Mapper]): The mapper class.
+        **options: The mapper options.
+
+    Returns:
+        Mapper: The shared mapper instance.
+    """
+    key = (mapper_cls, tuple((name, _get_option_key(value)) for name, value in options.items()))
+    try:
+        mapper = _SHARED_MAPPERS.get(key)
+    except TypeError:
+        # unhashable options
+        return mapper_cls(**options)
+    if mapper is None:
+        mapper = _SHARED_MAPPERS[key] = mapper_cls(**options)
+    return mapper
+
+
+# Parameter-free mappers, a single instance serves every field
+_BOOL_MAPPER = mappers.BoolMapper()
+_OBJECTID_MAPPER = mappers.ObjectIdMapper(dump_str=False)
+_OBJECTID_STR_MAPPER = mappers.ObjectIdMapper(dump_str=True)
+
+# Query operators used by FieldProxy comparisons, bound once
+_Q_eq = Q._eq
+_Q_ne = Q._ne
+_Q_gt = Q._gt
+_Q_gte = Q._gte
+_Q_lt = Q._lt
+_Q_lte = Q._lte
+
+
 class FieldInfo:
     """
     Represents information about a field in a document.
@@ -37,6 +109,28 @@ class FieldInfo:
         - timeseries_meta_field (bool): Indicates whether the field is a timeseries meta field.
     """
 
+    __slots__ = (
+        '_owner',
+        '_name',
+        '_mapper',
+        '_parse',
+        '_dump',
+        '_alias',
+        '_id_field',
+        '_nullable',
+        '_default',
+        '_default_factory',
+        '_index',
+        '_unique',
+        '_unique_with',
+        '_sparse',
+        '_index_spec',
+        '_validator_name',
+        '_child_document_cls',
+        'timeseries_field',
+        'timeseries_meta_field',
+    )
+
     def __init__(
         self,
         mapper: Mapper,
@@ -57,11 +151,6 @@ class FieldInfo:
             alias = '_id'
             nullable = False
 
-        # Ensure default_factory is not null
-        if not default_factory:
-            def default_factory():
-                return default
-
         # Ensure unique_with as list and enable unique index
         if unique_with:
             unique = True
@@ -70,16 +159,23 @@ class FieldInfo:
         self._owner = None
         self._name = None
         self._mapper = mapper
-        self._alias = alias
+        # bound mapper methods, resolved once for the hot descriptor paths
+        self._parse = mapper.parse
+        self._dump = mapper.dump
+        self._alias = sys.intern(alias) if alias else alias
         self._id_field = id_field
         self._nullable = nullable
-        self._default_factory = default_factory
+        self._default = default
+        self._default_factory = default_factory or None
         self._index = index
         self._unique = unique
         self._unique_with = unique_with
         self._sparse = sparse
         self.timeseries_field = timeseries_field
         self.timeseries_meta_field = timeseries_meta_field
+        self._index_spec = None
+        self._validator_name = None
+        self._child_document_cls = EmptyValue
 
     @property
     def mapper(self) -> Mapper:
@@ -130,38 +226,62 @@ class FieldInfo:
             name: The name of the field.
         """
         self._owner = owner
-        self._name = name
+        self._name = sys.intern(name)
+        self._validator_name = f'validate_{name}'
+        # index keys and options depend only on field settings, build them once
+        self._index_spec = self._build_index_spec()
 
     def __get__(self, instance, owner):
         """
         Get the value of the field when accessed through an instance.
 
+        Class access returns the FieldInfo itself, wrap it into a FieldProxy to build query expressions.
+
         Args:
             instance: The instance of the owner class.
             owner: The owner class.
 
         Returns:
-            Any: The value of the field or EmptyValue if not set.
+            Any: The value of the field or EmptyValue if not set, the field itself on class access.
         """
-        if not instance:
-            pass  # TODO impl FieldProxy
-        value = instance.__data__.get(self.name, EmptyValue)
+        # class access, the field itself
+        if instance is None:
+            return self
+        value = instance.__data__.get(self._name, EmptyValue)
         if value is not EmptyValue:
-            return self.mapper.dump(value)
+            return self._dump(value)
         return EmptyValue
 
-    def __set__(self, instance, value, **options):
+    def __set__(
+        self,
+        instance,
+        value,
+        use_defaults: bool = False,
+        strict: bool = True,
+        parse_bson: bool = False,
+        **options
+    ):
         """
         Set the value of the field when assigned through an instance.
 
         Args:
             instance: The instance of the owner class.
             value: The value to be set.
+            use_defaults: If True, uses the field default for empty values.
+            strict: If True, raises errors for unknown data types.
+            parse_bson: If True, parses BSON data.
             **options: Additional options for setting the value.
         """
-        value = self.parse(value, instance=instance, **options)
+        value = self.parse(
+            value,
+            instance=instance,
+            use_defaults=use_defaults,
+            strict=strict,
+            parse_bson=parse_bson,
+            **options
+        )
         if value is not EmptyValue:
-            instance.__data__[self.name] = value
+            instance.__data__[self._name] = value
 
     def __delete__(self, instance):
         """
@@ -170,7 +290,26 @@ class FieldInfo:
         Args:
             instance: The instance of the owner class.
         """
-        instance.__data__.pop(self.name, None)
+        instance.__data__.pop(self._name, None)
+
+    def _get_child_document_cls(self) -> Type['EmbeddedDocument'] | None:
+        """
+        Get the embedded or referenced document class of the field, resolved on first access.
+
+        Returns:
+            Type['EmbeddedDocument'] or None: The document class or None if the field doesn't hold documents.
+        """
+        if self._child_document_cls is EmptyValue:
+            # Unwrap ListMapper
+            mapper = self._mapper
+            if mapper._is_sequence:
+                mapper = mapper.inner_mapper
+            # document classes may be declared by name, resolve them lazily
+            if isinstance(mapper, mappers.EmbeddedDocumentMapper):
+                self._child_document_cls = mapper.document_cls
+            else:
+                self._child_document_cls = None
+        return self._child_document_cls
 
     def get_index(self) -> pymongo.IndexModel | None:
         """
@@ -179,20 +318,35 @@ class FieldInfo:
         Returns:
             pymongo.IndexModel or None: The index model or None if no index is specified.
         """
-        index = {}
-        if self._unique or self._sparse:
-            index[self.alias] = pymongo.ASCENDING
+        if self._index_spec is None:
+            return None
+        # a new model on each call, the cached keys and options are never handed out
+        index_keys, index_options = self._index_spec
+        return pymongo.IndexModel(list(index_keys), **index_options)
+
+    def _build_index_spec(self) -> tuple[tuple, dict] | None:
+        """
+        Build the keys and options of the MongoDB index model for the field.
+
+        Returns:
+            tuple or None: The index keys and options, including the generated name, or None if no index is specified.
+        """
+        alias = self.alias
+        keys = []
         if self._index is not None:
-            index[self.alias] = self._index
+            keys.append((alias, self._index))
+        elif self._unique or self._sparse:
+            keys.append((alias, pymongo.ASCENDING))
         if self._unique_with:
-            for key in self._unique_with:
-                index[key] = pymongo.ASCENDING
-        if index:
-            return pymongo.IndexModel(
-                [(field, idx) for field, idx in index.items()],
+            keys.extend((key, pymongo.ASCENDING) for key in self._unique_with if key != alias)
+        if keys:
+            index_options = dict(pymongo.IndexModel(
+                keys,
                 unique=self._unique,
                 sparse=self._sparse
-            )
+            ).document)
+            del index_options['key']
+            return tuple(keys), index_options
         return None
 
     def parse(self, value, **options):
@@ -209,22 +363,21 @@ class FieldInfo:
         Raises:
             ValidationError: If parsing or validation fails.
         """
-        use_defaults = options['use_defaults']
-
-        # Use default if value is empty
-        if value is EmptyValue and use_defaults:
-            value = self._default_factory()
-
-        # Return an empty value
+        # Use default if value is empty, otherwise return the empty value
         if value is EmptyValue:
-            return value
+            default_factory = self._default_factory
+            # EmptyValue as default means no default at all
+            if (default_factory is None and self._default is EmptyValue) or not options['use_defaults']:
+                return value
+            value = self._default if default_factory is None else default_factory()
+            if value is EmptyValue:
+                return value
 
         # Check nullability
         if value is None:
             if not self._nullable:
                 raise ValueError('Null value not allowed')
-            else:
-                return value
+            return value
 
         # Add field level options
         options['owner'] = self._owner
@@ -232,23 +385,31 @@ class FieldInfo:
 
         try:
             # Mapper parsing
-            value = self.mapper.parse(value, **options)
+            value = self._parse(value, **options)
 
             # Owner instance validator
-            validator = getattr(options['instance'], f'validate_{self.name}', None)
-            if validator and inspect.ismethod(validator):
+            validator = getattr(options['instance'], self._validator_name, None)
+            if validator is not None and callable(validator):
                 validator(value)
 
-        except ValidationError as e:
-            raise ValidationError(
-                errors=[ErrorWrapper(loc=self.name, error=err) for err in e.errors]
-            ) from None
         except Exception as e:
-            raise ValidationError(
-                errors=[ErrorWrapper(loc=self.name, error=e)]
-            ) from None
+            raise self._wrap_error(e) from None
 
         return value
+
+    def _wrap_error(self, error: Exception) -> ValidationError:
+        """
+        Wrap a parsing or validation error with the field location, kept out of the parse hot path.
+
+        Args:
+            error (Exception): The raised error.
+
+        Returns:
+            ValidationError: The validation error located at this field.
+        """
+        if not isinstance(error, ValidationError):
+            return ValidationError(errors=[ErrorWrapper(loc=self._name, error=error)])
+        return ValidationError(errors=[ErrorWrapper(loc=self._name, error=err) for err in error.errors])
     
     
 class FieldProxy:
@@ -291,9 +452,13 @@ class FieldProxy:
 
     """
 
+    __slots__ = ('_field', '_parent', '_alias')
+
     def __init__(self, field: FieldInfo, parent: 'FieldProxy' = None):
         self._field = field
         self._parent = parent
+        # proxies are immutable, build the alias path once, considering the parent's alias if present
+        self._alias = f'{parent._alias}.{field.alias}' if parent else field.alias
 
     @property
     def field(self) -> FieldInfo:
@@ -305,18 +470,6 @@ class FieldProxy:
         """
         return self._field
 
-    @property
-    def _alias(self) -> str:
-        """
-        Get the alias of the field, considering the parent's alias if present.
-
-        Returns:
-            str: The alias of the field.
-        """
-        if self._parent:
-            return f'{self._parent._alias}.{self.field.alias}'
-        return self.field.alias
-
     def __str__(self):
         """
         Returns the string representation of the field's alias.
@@ -354,7 +507,7 @@ class FieldProxy:
         Returns:
             Q: Query object representing equality comparison.
         """
-        return Q._eq(self._alias, other)
+        return _Q_eq(self._alias, other)
 
     def __ne__(self, other):
         """
@@ -366,7 +519,7 @@ class FieldProxy:
         Returns:
             Q: Query object representing inequality comparison.
         """
-        return Q._ne(self._alias, other)
+        return _Q_ne(self._alias, other)
 
     def __gt__(self, other):
         """
@@ -378,7 +531,7 @@ class FieldProxy:
         Returns:
             Q: Query object representing greater-than comparison.
         """
-        return Q._gt(self._alias, other)
+        return _Q_gt(self._alias, other)
 
     def __ge__(self, other):
         """
@@ -390,7 +543,7 @@ class FieldProxy:
         Returns:
             Q: Query object representing greater-than-or-equal-to comparison.
         """
-        return Q._gte(self._alias, other)
+        return _Q_gte(self._alias, other)
 
     def __lt__(self, other):
         """
@@ -402,7 +555,7 @@ class FieldProxy:
         Returns:
             Q: Query object representing less-than comparison.
         """
-        return Q._lt(self._alias, other)
+        return _Q_lt(self._alias, other)
 
     def __le__(self, other):
         """
@@ -414,7 +567,7 @@ class FieldProxy:
         Returns:
             Q: Query object representing less-than-or-equal-to comparison.
         """
-        return Q._lte(self._alias, other)
+        return _Q_lte(self._alias, other)
 
     def __getattr__(self, item):
         """
@@ -429,23 +582,19 @@ class FieldProxy:
         Raises:
             FieldError: If the nested field is not found in the document.
         """
-        # Unwrap ListMapper
-        mapper = self.field.mapper
-        if isinstance(mapper, mappers.ListMapper):
-            mapper = mapper.inner_mapper
-
-        if not isinstance(mapper, (mappers.EmbeddedDocumentMapper, mappers.ReferencedDocumentMapper)):
+        document_cls = self._field._get_child_document_cls()
+        if document_cls is None:
             raise FieldError(
                 f'FieldProxy for {self.field.name} does not expose field attributes, '
                 f'use {self.field.name}.field property instead to access field info instance'
             )
 
-        fields = mapper.document_cls.__fields__
-        if item not in fields:
-            raise FieldError(f'Field {item} not found in document {mapper.document_cls}')
+        field = document_cls.__fields__.get(item)
+        if field is None:
+            raise FieldError(f'Field {item} not found in document {document_cls}')
 
         return FieldProxy(
-            field=fields[item],
+            field=field,
             parent=self
         )
     
@@ -549,9 +698,7 @@ def ObjectIdField(
     dump_str: bool = False
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.ObjectIdMapper(
-            dump_str==dump_str
-        ),
+        mapper=_OBJECTID_STR_MAPPER if dump_str else _OBJECTID_MAPPER,
         alias=alias,
         id_field=id_field,
         nullable=nullable,
@@ -581,7 +728,8 @@ def UUIDField(
     dump_bson_binary: bool = False,
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.UUIDMapper(
+        mapper=_get_mapper(
+            mappers.UUIDMapper,
             uuid_version=uuid_version,
             uuid_repr=uuid_repr,
             parse_str=parse_str,
@@ -614,7 +762,8 @@ def BinaryField(
     dump_base64: bool = False
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.BinaryMapper(
+        mapper=_get_mapper(
+            mappers.BinaryMapper,
             parse_base64=parse_base64,
             dump_base64=dump_base64
         ),
@@ -643,10 +792,14 @@ def StrField(
     min_len: int = None,
     max_len: int = None,
     choices: list[str] = None,
-    regex: re.Pattern = None
+    regex: re.Pattern | str = None
 ) -> FieldInfo:
+    # Compile string patterns once, identical patterns share one compiled pattern
+    if isinstance(regex, str):
+        regex = _compile_regex(regex)
     return FieldInfo(
-        mapper=mappers.StrMapper(
+        mapper=_get_mapper(
+            mappers.StrMapper,
             min_len=min_len,
             max_len=max_len,
             choices=choices,
@@ -684,7 +837,8 @@ def IntField(
     dump_bson_int64: bool = False
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.IntMapper(
+        mapper=_get_mapper(
+            mappers.IntMapper,
             gt=gt,
             gte=gte,
             lt=lt,
@@ -722,7 +876,8 @@ def FloatField(
     lte: float = None
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.DecimalMapper(
+        mapper=_get_mapper(
+            mappers.DecimalMapper,
             gt=gt,
             gte=gte,
             lt=lt,
@@ -758,7 +913,8 @@ def DecimalField(
     lte: float = None
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.DecimalMapper(
+        mapper=_get_mapper(
+            mappers.DecimalMapper,
             gt=gt,
             gte=gte,
             lt=lt,
@@ -790,7 +946,7 @@ def BooleanField(
     sparse: bool = False
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.BoolMapper(),
+        mapper=_BOOL_MAPPER,
         alias=alias,
         id_field=id_field,
         nullable=nullable,
@@ -822,7 +978,8 @@ def DatetimeField(
     dump_format: str = None
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.DatetimeMapper(
+        mapper=_get_mapper(
+            mappers.DatetimeMapper,
             gt=gt,
             gte=gte,
             lt=lt,
@@ -862,7 +1019,8 @@ def DateField(
     dump_format: str = None
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.DateMapper(
+        mapper=_get_mapper(
+            mappers.DateMapper,
             gt=gt,
             gte=gte,
             lt=lt,
@@ -902,7 +1060,8 @@ def TimeField(
     dump_format: str = None
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.TimeMapper(
+        mapper=_get_mapper(
+            mappers.TimeMapper,
             gt=gt,
             gte=gte,
             lt=lt,
@@ -940,7 +1099,8 @@ def DatetimeMSField(
     dump_datetime: bool = False
 ) -> FieldInfo:
     return FieldInfo(
-        mapper=mappers.DatetimeMSMapper(
+        mapper=_get_mapper(
+            mappers.DatetimeMSMapper,
             gt=gt,
             gte=gte,
             lt=lt,
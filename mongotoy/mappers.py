@@ -6,7 +6,6 @@ import re
 from typing import TYPE_CHECKING, Type
 import uuid
 import bson
-from mongotoy.documents import EmbeddedDocument
 from mongotoy.errors import DocumentError, ErrorWrapper, MapperError, ValidationError
 
 if TYPE_CHECKING:
@@ -25,6 +24,14 @@ class Mapper:
 
     These functions can be overridden in derived classes for custom behavior.
     """
+
+    __slots__ = ()
+
+    # class tags, checked instead of isinstance when building document plans
+    _is_sequence = False
+    _is_referenced = False
+    # exact type of values returned unchanged by parse, enables the ListMapper fast path
+    _expected_type = None
     
     def parse(self, value, **options):
         """
@@ -89,6 +96,10 @@ class ListMapper(Mapper):
         should be greater than 0 and less than 10. The list length should be between 2 and 5.
         ```
     """
+
+    __slots__ = ('_inner_mapper', '_min_len', '_max_len', '_item_type')
+
+    _is_sequence = True
     
     def __init__(
         self,
@@ -102,6 +113,14 @@ class ListMapper(Mapper):
         self._inner_mapper = inner_mapper
         self._min_len = min_len
         self._max_len = max_len
+
+        # Values of the exact expected type are returned unchanged by the inner mapper,
+        # unless a subclass overrides the parse declared alongside the expected type
+        item_type = inner_mapper._expected_type
+        parse_owner = next(cls for cls in type(inner_mapper).__mro__ if 'parse' in cls.__dict__)
+        if '_expected_type' not in parse_owner.__dict__:
+            item_type = None
+        self._item_type = item_type
         
     @property
     def inner_mapper(self):
@@ -134,6 +153,11 @@ class ListMapper(Mapper):
         if self._max_len is not None and value_len > self._max_len:
             raise ValueError(f'Invalid length {value_len}, max allowed is {self._max_len}')
         
+        # Skip per-item parsing when every value is of the exact expected type
+        item_type = self._item_type
+        if item_type is not None and all(type(val) is item_type for val in value):
+            return list(value)
+
         # Get validated values
         new_value = []
         for i, val in enumerate(value):
@@ -191,6 +215,8 @@ class EmbeddedDocumentMapper(Mapper):
         address_mapper = EmbeddedDocumentMapper(document_cls="Address")
         ```
     """
+
+    __slots__ = ('_document_cls',)
     
     def __init__(self, document_cls: Type['EmbeddedDocument'] | str):
         self._document_cls = document_cls
@@ -286,11 +312,16 @@ class ReferencedDocumentMapper(EmbeddedDocumentMapper):
         ```
 
     Properties:
+        - key_name (str): The name of the field storing the reference value.
         - is_back_ref (bool): Indicates whether the mapper represents a back reference.
         - ref (FieldInfo): The field information for the reference field.
         - back_ref (FieldInfo): The field information for the back reference field.
     """
 
+    __slots__ = ('_key_name', '_ref', '_back_ref')
+
+    _is_referenced = True
+
     def __init__(
         self,
         key_name: str,
@@ -310,6 +341,16 @@ class ReferencedDocumentMapper(EmbeddedDocumentMapper):
         self._ref = ref
         self._back_ref = back_ref
 
+    @property
+    def key_name(self) -> str:
+        """
+        Get the name of the field storing the reference value.
+
+        Returns:
+            str: The key name of the reference.
+        """
+        return self._key_name
+
     @property
     def is_back_ref(self) -> bool:
         """
@@ -402,6 +443,8 @@ class ObjectIdMapper(Mapper):
         dumped_value = string_id_mapper.dump(parsed_object_id)
         ```
     """
+
+    __slots__ = ('_dump_str',)
     
     def __init__(self, dump_str: bool = False):
         self._dump_str = dump_str
@@ -462,6 +505,8 @@ class UUIDMapper(Mapper):
         dumped_value = uuid_mapper.dump(parsed_uuid)
         ```
     """
+
+    __slots__ = ('_uuid_version', '_uuid_repr', '_parse_str', '_dump_str', '_dump_bson_binary')
     
     def __init__(
         self,
@@ -562,6 +607,8 @@ class BinaryMapper(Mapper):
         dumped_value = binary_mapper.dump(parsed_binary)
         ```
     """
+
+    __slots__ = ('_parse_base64', '_dump_base64')
     
     def __init__(
         self,
@@ -642,6 +689,8 @@ class StrMapper(Mapper):
             print(ve)
         ```
     """
+
+    __slots__ = ('_min_len', '_max_len', '_choices', '_regex', '_expected_type')
     
     def __init__(
         self,
@@ -654,6 +703,9 @@ class StrMapper(Mapper):
         self._max_len = max_len
         self._choices = choices
         self._regex = regex
+        # unconstrained strings pass through unchanged
+        unconstrained = min_len is None and max_len is None and not choices and not regex
+        self._expected_type = str if unconstrained else None
         
     def parse(self, value, **options):
         """
@@ -715,6 +767,8 @@ class IntMapper(Mapper):
             print(ve)
         ```
     """
+
+    __slots__ = ('_gt', '_gte', '_lt', '_lte', '_mul', '_parse_hex', '_dump_hex', '_dump_bson_int64', '_expected_type')
     
     def __init__(
         self,        
@@ -735,6 +789,9 @@ class IntMapper(Mapper):
         self._parse_hex = parse_hex
         self._dump_hex = dump_hex
         self._dump_bson_int64 = dump_bson_int64
+        # unconstrained integers pass through unchanged
+        unconstrained = gt is None and gte is None and lt is None and lte is None and mul is None
+        self._expected_type = int if unconstrained else None
         
     def parse(self, value, **options):
         """
@@ -840,6 +897,8 @@ class DecimalMapper(Mapper):
             print(ve)
         ```
     """
+
+    __slots__ = ('_gt', '_gte', '_lt', '_lte', '_dump_float', '_dump_bson_decimal128')
     
     def __init__(
         self,        
@@ -958,6 +1017,10 @@ class BoolMapper(Mapper):
             print(te)
         ```
     """
+
+    __slots__ = ()
+
+    _expected_type = bool
     
     def parse(self, value, **options):
         """
@@ -1040,6 +1103,8 @@ class DatetimeMapper(Mapper):
         ValueError: If the provided datetime constraints are invalid.
         TypeError: If the provided formats are not valid strings or if the parsed value is not a datetime object.
     """
+
+    __slots__ = ('_gt', '_gte', '_lt', '_lte', '_parse_format', '_dump_str', '_dump_format')
     
     def __init__(
         self,        
@@ -1167,6 +1232,8 @@ class DateMapper(DatetimeMapper):
         Same as DatetimeMapper.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         gt: datetime.date = None,
@@ -1265,6 +1332,8 @@ class TimeMapper(DatetimeMapper):
         Same as DatetimeMapper.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         gt: datetime.time = None,
@@ -1355,6 +1424,8 @@ class DatetimeMSMapper(Mapper):
         ValueError: If the provided datetime constraints are invalid.
         TypeError: If the parsed value is not a datetime object or an integer.
     """
+
+    __slots__ = ('_gt', '_gte', '_lt', '_lte', '_dump_datetime')
     
     def __init__(
         self,
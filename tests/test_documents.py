@@ -0,0 +1,153 @@
+import bson
+import pytest
+
+from mongotoy import documents, errors, fields
+
+
+class ClassAccessDoc(documents.Document):
+    name = fields.StrField()
+
+
+def test_class_access_returns_field():
+    assert isinstance(ClassAccessDoc.name, fields.FieldInfo)
+    assert ClassAccessDoc.name is ClassAccessDoc.__fields__['name']
+
+
+class IndexedAddress(documents.EmbeddedDocument):
+    street = fields.StrField(index=1)
+
+
+class IndexedPerson(documents.Document):
+    name = fields.StrField(unique=True)
+    address = fields.EmbeddedDocumentField(IndexedAddress, alias='addr')
+
+
+def test_get_indexes_repeated_calls():
+    first = [index.document for index in IndexedPerson.get_indexes()]
+    second = [index.document for index in IndexedPerson.get_indexes()]
+    assert first == second
+    assert [dict(index['key']) for index in first] == [{'name': 1}, {'addr.street': 1}]
+
+
+def test_get_indexes_keeps_embedded_keys():
+    IndexedPerson.get_indexes()
+    IndexedPerson.get_indexes()
+    assert [dict(index.document['key']) for index in IndexedAddress.get_indexes()] == [{'street': 1}]
+
+
+class RefAuthor(documents.Document):
+    name = fields.StrField()
+    books = fields.ListField(fields.ReferencedDocumentField('author_id', 'RefBook', back_ref='author'))
+
+
+class RefBook(documents.Document):
+    title = fields.StrField()
+    author = fields.ReferencedDocumentField('author_id', RefAuthor, ref='id')
+
+
+def test_referenced_field_dumped_under_key_name():
+    author = RefAuthor(name='A')
+    book = RefBook(title='T', author=author)
+    assert list(book.dump_bson()) == ['_id', 'title', 'author_id']
+    assert list(book.dump_bson(by_alias=False)) == ['id', 'title', 'author']
+    assert book.dump_bson()['author_id'] == author.id
+
+
+def test_back_referenced_field_not_dumped():
+    author = RefAuthor(name='A')
+    assert list(author.dump_bson()) == ['_id', 'name']
+
+
+class AssignDoc(documents.Document):
+    age = fields.IntField(gt=0)
+    address = fields.EmbeddedDocumentField(IndexedAddress, nullable=True)
+
+
+def test_assign_field():
+    doc = AssignDoc(age=1)
+    doc.age = 2
+    assert doc.age == 2
+    doc['age'] = 3
+    assert doc.age == 3
+    doc.address = IndexedAddress(street='x')
+    assert doc.address.street == 'x'
+
+
+def test_assign_invalid_field():
+    doc = AssignDoc(age=1)
+    with pytest.raises(errors.ValidationError):
+        doc.age = -1
+    assert doc.age == 1
+
+
+class BsonAddress(documents.EmbeddedDocument):
+    street = fields.StrField()
+    zip_code = fields.IntField(gt=0)
+
+    def validate_street(self, value):
+        raise ValueError('validators must not run')
+
+
+class BsonPerson(documents.Document):
+    name = fields.StrField(alias='full_name', nullable=False)
+    age = fields.IntField()
+    address = fields.EmbeddedDocumentField(BsonAddress, nullable=True)
+    addresses = fields.ListField(fields.EmbeddedDocumentField(BsonAddress))
+    author = fields.ReferencedDocumentField('author_id', RefAuthor, ref='id')
+
+
+def test_from_bson_plain_fields():
+    oid = bson.ObjectId()
+    doc = BsonPerson.from_bson({'_id': oid, 'full_name': 'A', 'age': 1})
+    assert doc.id == oid
+    assert doc.name == 'A'
+    assert doc.age == 1
+
+
+def test_from_bson_int64():
+    doc = BsonPerson.from_bson({'age': bson.Int64(5)})
+    assert doc.age == 5
+    assert type(doc.age) is int
+
+
+def test_from_bson_embedded():
+    doc = BsonPerson.from_bson({
+        'address': {'street': 'x', 'zip_code': 1},
+        'addresses': [{'street': 'y'}, {'zip_code': bson.Int64(2)}],
+    })
+    assert isinstance(doc.address, BsonAddress)
+    assert doc.address.street == 'x'
+    assert doc.address.zip_code == 1
+    assert [type(address) for address in doc.addresses] == [BsonAddress, BsonAddress]
+    assert doc.addresses[0].street == 'y'
+    assert type(doc.addresses[1].zip_code) is int
+
+
+def test_from_bson_skips_reference_keys():
+    author_id = bson.ObjectId()
+    doc = BsonPerson.from_bson({'author_id': author_id, 'author': author_id})
+    assert 'author' not in doc.__data__
+
+
+def test_from_bson_missing_and_none_values():
+    doc = BsonPerson.from_bson({'full_name': None, 'address': None})
+    assert doc.name is None
+    assert doc.address is None
+    assert doc.age is fields.EmptyValue
+    assert 'id' not in doc.__data__
+
+
+def test_get_indexes_returns_copies():
+    IndexedPerson.get_indexes()[0].document['unique'] = False
+    IndexedPerson.__fields__['name'].get_index().document['unique'] = False
+    assert [index.document['unique'] for index in IndexedPerson.get_indexes()] == [True, False]
+    assert IndexedPerson.__fields__['name'].get_index().document['unique'] is True
+
+
+class TwoAddressPerson(documents.Document):
+    home = fields.EmbeddedDocumentField(IndexedAddress)
+    work = fields.EmbeddedDocumentField(IndexedAddress)
+
+
+def test_embedded_index_names_use_prefixed_keys():
+    assert [index.document['name'] for index in TwoAddressPerson.get_indexes()] == ['home.street_1', 'work.street_1']
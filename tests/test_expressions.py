@@ -0,0 +1,91 @@
+import re
+
+import pytest
+
+from mongotoy.errors import FieldError
+from mongotoy.expressions import Q, QueryExpression
+
+
+def test_q_lte():
+    assert Q._lte('x', 1) == {'x': {'$lte': 1}}
+
+
+def test_q_returns_query_expression():
+    q = Q(name__eq='John', age__gt=25)
+    assert isinstance(q, QueryExpression)
+    assert q == {'name': {'$eq': 'John'}, 'age': {'$gt': 25}}
+
+
+def test_q_nested_field():
+    assert Q(address__street__eq='Main') == {'address.street': {'$eq': 'Main'}}
+
+
+def test_q_same_field_uses_and():
+    q = Q(x__gt=1, x__lt=5)
+    assert isinstance(q, QueryExpression)
+    assert q == {'$and': [{'x': {'$gt': 1}}, {'x': {'$lt': 5}}]}
+
+
+def test_q_missing_operator():
+    with pytest.raises(FieldError):
+        Q(x=1)
+
+
+def test_q_unknown_operator():
+    with pytest.raises(FieldError):
+        Q(x__foo=1)
+
+
+def test_q_match_str_unchanged():
+    assert Q(name__match='^Jo') == {'name': {'$regex': '^Jo'}}
+    pattern = re.compile('^Jo')
+    assert Q(name__match=pattern)['name']['$regex'] is pattern
+
+
+def test_and():
+    q = Q(a__eq=1) & Q(b__eq=2)
+    assert isinstance(q, QueryExpression)
+    assert q == {'$and': [{'a': {'$eq': 1}}, {'b': {'$eq': 2}}]}
+
+
+def test_or():
+    q = Q(a__eq=1) | Q(b__eq=2)
+    assert isinstance(q, QueryExpression)
+    assert q == {'$or': [{'a': {'$eq': 1}}, {'b': {'$eq': 2}}]}
+
+
+def test_and_or_skip_empty():
+    q = Q(a__eq=1)
+    assert q & QueryExpression() is q
+    assert QueryExpression() & q is q
+    assert q | QueryExpression() is q
+    assert QueryExpression() | q is q
+
+
+def test_all_flattens_nested_and():
+    a, b, c = QueryExpression({'a': 1}), QueryExpression({'b': 2}), QueryExpression({'c': 3})
+    assert QueryExpression.all([QueryExpression.all([a, b]), c]) == {'$and': [{'a': 1}, {'b': 2}, {'c': 3}]}
+
+
+def test_all_keeps_nested_or():
+    a, b, c = QueryExpression({'a': 1}), QueryExpression({'b': 2}), QueryExpression({'c': 3})
+    q = QueryExpression.all([QueryExpression.any([a, b]), c])
+    assert q == {'$and': [{'$or': [{'a': 1}, {'b': 2}]}, {'c': 3}]}
+
+
+def test_all_skips_empty():
+    assert QueryExpression.all([]) == {}
+    assert QueryExpression.all([QueryExpression(), QueryExpression({'a': 1})]) == {'a': 1}
+
+
+def test_compile_plain_dicts():
+    compiled = (Q(a__eq=1) & Q(b__in=[1, 2])).compile()
+    assert type(compiled) is dict
+    assert all(type(exp) is dict for exp in compiled['$and'])
+
+
+def test_all_single_unwrapped_item():
+    q = QueryExpression.all([QueryExpression({'$and': [{'a': 1}]}), QueryExpression()])
+    assert type(q) is QueryExpression
+    assert q == {'a': 1}
+    assert q & QueryExpression({'b': 2}) == {'$and': [{'a': 1}, {'b': 2}]}
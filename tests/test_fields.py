@@ -0,0 +1,89 @@
+import bson
+import pytest
+
+from mongotoy import errors, fields, mappers
+
+
+def test_objectid_dump():
+    oid = bson.ObjectId()
+    dumped = fields.ObjectIdField().mapper.dump(oid)
+    assert isinstance(dumped, bson.ObjectId)
+    assert dumped == oid
+
+
+def test_objectid_dump_str():
+    oid = bson.ObjectId()
+    assert fields.ObjectIdField(dump_str=True).mapper.dump(oid) == str(oid)
+
+
+def test_objectid_dump_bson():
+    oid = bson.ObjectId()
+    assert fields.ObjectIdField(dump_str=True).mapper.dump_bson(oid) == oid
+
+
+def test_str_field_list_options():
+    assert fields.StrField(choices=[]).mapper is fields.StrField(choices=[]).mapper
+    assert fields.StrField(choices=['a']).mapper is not fields.StrField(choices=['b']).mapper
+
+
+def test_int_field_options_of_different_types():
+    int_mapper = fields.IntField(gt=1).mapper
+    float_mapper = fields.IntField(gt=1.0).mapper
+    assert int_mapper is not float_mapper
+    assert type(int_mapper._gt) is int
+    assert type(float_mapper._gt) is float
+
+
+def test_fields_with_same_options_share_mapper():
+    assert fields.StrField().mapper is fields.StrField().mapper
+    assert fields.StrField(max_len=3).mapper is fields.StrField(max_len=3).mapper
+    assert fields.StrField(max_len=3).mapper is not fields.StrField(max_len=4).mapper
+
+
+def test_list_parse_unconstrained_items():
+    value = ['a', 'b']
+    parsed = fields.ListField(fields.StrField()).mapper.parse(value, strict=True, parse_bson=False)
+    assert parsed == value
+    assert parsed is not value
+
+
+def test_list_parse_constrained_items():
+    mapper = fields.ListField(fields.StrField(max_len=1)).mapper
+    with pytest.raises(errors.ValidationError) as exc:
+        mapper.parse(['a', 'bc'], strict=True, parse_bson=False)
+    assert exc.value.errors[0].loc == ('1',)
+
+
+def test_list_parse_mixed_items():
+    mapper = fields.ListField(fields.StrField()).mapper
+    with pytest.raises(errors.ValidationError) as exc:
+        mapper.parse(['a', 1], strict=True, parse_bson=False)
+    assert exc.value.errors[0].loc == ('1',)
+
+
+def test_list_parse_int64_items():
+    parsed = fields.ListField(fields.IntField()).mapper.parse(
+        [1, bson.Int64(2)],
+        strict=False,
+        parse_bson=True
+    )
+    assert parsed == [1, 2]
+    assert [type(val) for val in parsed] == [int, int]
+
+
+class LowerStrMapper(mappers.StrMapper):
+    __slots__ = ()
+
+    def parse(self, value, **options):
+        return super().parse(value, **options).lower()
+
+
+def test_list_parse_overridden_inner_parse():
+    mapper = mappers.ListMapper(inner_mapper=LowerStrMapper())
+    assert mapper.parse(['A', 'b'], strict=True, parse_bson=False) == ['a', 'b']
+
+
+def test_str_field_choices_error_keeps_list():
+    mapper = fields.StrField(choices=['a', 'b']).mapper
+    with pytest.raises(ValueError, match=r"\['a', 'b'\]"):
+        mapper.parse('c', strict=True, parse_bson=False)